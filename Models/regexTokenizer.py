@@ -1,5 +1,6 @@
 
 
+import re as ascii_re
 import regex  as re
 from .base import Tokenization, get_stats , merge
 
@@ -7,6 +8,18 @@ from .base import Tokenization, get_stats , merge
 GPT2_SPLIT_PATTERN = r"""'(?:[sdmt]|ll|ve|re)| ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+"""
 GPT4_SPLIT_PATTERN = r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}+|\p{N}{1,3}| ?[^\s\p{L}\p{N}]++[\r\n]*|\s*[\r\n]|\s+(?!\S)|\s+"""
 
+# The same split patterns restricted to ASCII input, where \p{L}, \p{N} and \s
+# collapse to plain byte ranges. The stdlib re engine runs these a lot faster
+# than the Unicode-property versions above and yields exactly the same chunks,
+# so pure-ASCII text (most code and English) is routed through them.
+GPT2_ASCII_SPLIT_PATTERN = r"""'(?:[sdmt]|ll|ve|re)| ?[a-zA-Z]+| ?[0-9]+| ?[^\t\n\v\f\r a-zA-Z0-9]+|[\t\n\v\f\r ]+(?![^\t\n\v\f\r ])|[\t\n\v\f\r ]+"""
+GPT4_ASCII_SPLIT_PATTERN = r"""'(?i:[sdmt]|ll|ve|re)|[^\r\na-zA-Z0-9]?[a-zA-Z]+|[0-9]{1,3}| ?[^\t\n\v\f\r a-zA-Z0-9]+[\r\n]*|[\t\n\v\f\r ]*[\r\n]|[\t\n\v\f\r ]+(?![^\t\n\v\f\r ])|[\t\n\v\f\r ]+"""
+
+ASCII_SPLIT_PATTERNS = {
+    GPT2_SPLIT_PATTERN: ascii_re.compile(GPT2_ASCII_SPLIT_PATTERN),
+    GPT4_SPLIT_PATTERN: ascii_re.compile(GPT4_ASCII_SPLIT_PATTERN),
+}
+
 
 class RegexTokenization(Tokenization):
 
@@ -14,6 +27,8 @@ class RegexTokenization(Tokenization):
         super().__init__()
         self.pattern = GPT4_SPLIT_PATTERN if pattern is None else pattern
         self.compiled_pattern  = re.compile(self.pattern)
+        # ASCII fast path, only available for the built-in patterns
+        self.compiled_ascii_pattern = ASCII_SPLIT_PATTERNS.get(self.pattern)
         self.special_token = {}
         self.inverse_special_token = {}
 
@@ -21,7 +36,10 @@ class RegexTokenization(Tokenization):
         assert vocab_size >= 256
         num_merges = vocab_size-256
 
-        text_chunk = re.findall(GPT4_SPLIT_PATTERN,text)
+        if text.isascii():
+            text_chunk = ASCII_SPLIT_PATTERNS[GPT4_SPLIT_PATTERN].findall(text)
+        else:
+            text_chunk = re.findall(GPT4_SPLIT_PATTERN,text)
         ids = [list(ch.encode("utf-8")) for ch in text_chunk ]
 
         merges = {}
@@ -83,8 +101,15 @@ class RegexTokenization(Tokenization):
         return ids
 
 
+    def split_text(self, text):
+        # pure-ASCII input can skip the Unicode-property regex
+        if self.compiled_ascii_pattern is not None and text.isascii():
+            return self.compiled_ascii_pattern.findall(text)
+        return re.findall(self.compiled_pattern,text)
+
+
     def encode_ordinary(self, text):
-        text_chunks = re.findall(self.compiled_pattern,text)
+        text_chunks = self.split_text(text)
         print(len(text_chunks))
         ids =[]
         for chunk in text_chunks:
@@ -1,11 +1,14 @@
 import pytest
 import os
+import random
+
+import regex
 
 import tiktoken
 
 from Models import GPT_4Tokenizer
 from Models.basicTokenizer import BasicTokenizer
-from Models.regexTokenizer import RegexTokenization
+from Models.regexTokenizer import RegexTokenization, GPT2_SPLIT_PATTERN, GPT4_SPLIT_PATTERN
 from train import tokenizer
 
 # -----------------------------------------------------------------------------
@@ -132,6 +135,41 @@ def test_save_load(special_tokens):
         os.remove(file)
 
 
+def random_ascii_strings(n, seed=1337):
+    # heavy on the characters where the split patterns disagree or backtrack
+    alphabet = "aZsStTlLvVeErR09 \t\n\r\v\f'!.,_-\x00\x1c\x1f\x7f"
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16))) for _ in range(n)]
+
+ascii_test_strings = [s for s in map(uncap, test_strings) if s.isascii()] + [
+    "def f(x):\n    return x  \n\n\t# it's 12345 DON'T\r\n",
+    "'s 'LL 'Ve 're ' 'x !!!\n\n  ?!abc   ",
+    "".join(ch for ch in uncap("FILE:data.txt") if ch.isascii()),
+] + random_ascii_strings(2000)
+
+@pytest.mark.parametrize("pattern", [GPT2_SPLIT_PATTERN, GPT4_SPLIT_PATTERN])
+def test_ascii_split_matches_regex(pattern):
+    tokenizer = RegexTokenization(pattern)
+    assert tokenizer.compiled_ascii_pattern is not None
+    for text in ascii_test_strings:
+        assert tokenizer.split_text(text) == regex.findall(pattern, text), repr(text)
+
+def test_ascii_split_not_used_for_custom_pattern():
+    tokenizer = RegexTokenization(r"\w+|\s+")
+    assert tokenizer.compiled_ascii_pattern is None
+    assert tokenizer.split_text("hi there") == ["hi", " ", "there"]
+
+def test_train_ascii_fast_path():
+    text = "".join(ch for ch in uncap("FILE:data.txt") if ch.isascii())[:5000]
+    tokenizer = RegexTokenization()
+    tokenizer.train(text, 256+32)
+    assert tokenizer.decode(tokenizer.encode(text)) == text
+    # no merge may cross a chunk boundary of the regex split
+    chunks = set(regex.findall(GPT4_SPLIT_PATTERN, text))
+    for idx in tokenizer.merges.values():
+        token = tokenizer.vocab[idx].decode("utf-8")
+        assert any(token in chunk for chunk in chunks)
+
 
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file